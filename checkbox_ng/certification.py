@@ -27,19 +27,31 @@ certification tarball to the Canonical certification database.
 """
 
 from gettext import gettext as _
+from logging import DEBUG
 from logging import getLogger
-import re
 
 from plainbox.impl.secure.config import Unset
 from plainbox.impl.transport import InvalidSecureIDError
-from plainbox.impl.transport import SECURE_ID_PATTERN
 from plainbox.impl.transport import TransportBase
 from plainbox.impl.transport import TransportError
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+# orjson is optional; when present it decodes the server response noticeably
+# faster than the stdlib json module.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 
 logger = getLogger("checkbox.ng.certification")
 
+#: Default connect/read timeouts for submissions, in seconds. Without a
+#: timeout a stalled server would park the submission forever.
+DEFAULT_TIMEOUT = (10, 120)
+
 
 class SubmissionServiceTransport(TransportBase):
     """
@@ -56,11 +68,27 @@ class SubmissionServiceTransport(TransportBase):
 
         The options string may contain 'secure_id' which must be
         a 15-character (or longer)  alphanumeric ID for the system.
+        It may also contain 'timeout' to override the default read
+        timeout (in seconds) for the submission POST.
         """
         super().__init__(where, options)
+        try:
+            self._timeout = (
+                DEFAULT_TIMEOUT[0], float(self.options['timeout']))
+        except KeyError:
+            self._timeout = DEFAULT_TIMEOUT
         self._secure_id = self.options.get('secure_id')
         if self._secure_id is not None:
             self._validate_secure_id(self._secure_id)
+        # Submissions are serial POSTs to the same host so keep one session
+        # around; connection pooling saves a TCP+TLS handshake on every send
+        # after the first one. The adapter retries the usual transient
+        # gateway errors before giving up.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
     def send(self, data, config=None, session_state=None):
         """
@@ -110,12 +138,20 @@ class SubmissionServiceTransport(TransportBase):
             secure_id = self._secure_id
         if secure_id is None:
             raise InvalidSecureIDError(_("Secure ID not specified"))
-        self._validate_secure_id(secure_id)
-        logger.debug(
-            _("Sending to %s, Secure ID is %s"), self.url, secure_id)
+        if secure_id is not self._secure_id:
+            # The transport's own secure_id was already validated in
+            # __init__; only a value sourced from the configuration still
+            # needs checking here.
+            self._validate_secure_id(secure_id)
+        # Even with lazy %-formatting the gettext lookup runs per call, so
+        # check the level first.
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                _("Sending to %s, Secure ID is %s"), self.url, secure_id)
         try:
-            response = requests.post(
-                self.url, data=data, proxies=proxies)
+            response = self._session.post(
+                self.url, data=data, proxies=proxies,
+                timeout=self._timeout)
         except requests.exceptions.Timeout as exc:
             raise TransportError(
                 _("Request to {0} timed out: {1}").format(self.url, exc))
@@ -125,22 +161,33 @@ class SubmissionServiceTransport(TransportBase):
         except requests.exceptions.ConnectionError as exc:
             raise TransportError(
                 _("Unable to connect to {0}: {1}").format(self.url, exc))
-        if response is not None:
+        # Control only reaches this point with a real response object; post()
+        # either returns one or raises (handled above). On the common success
+        # path a plain status compare is all that is needed;
+        # raise_for_status() only runs to produce the error.
+        if response.status_code >= 400:
             try:
                 # This will raise HTTPError for status != 20x
                 response.raise_for_status()
             except requests.exceptions.RequestException as exc:
                 raise TransportError(str(exc))
+        if logger.isEnabledFor(DEBUG):
+            # response.text decodes the whole body; don't pay for it unless
+            # the message is actually going to be emitted.
             logger.debug("Success! Server said %s", response.text)
-            try:
-                return response.json()
-            except Exception as exc:
-                raise TransportError(str(exc))
+        try:
+            return _json.loads(response.content)
+        except Exception as exc:
+            raise TransportError(str(exc))
 
-        # ISessionStateTransport.send must return dictionary
-        return {}
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
     def _validate_secure_id(self, secure_id):
-        if not re.match(SECURE_ID_PATTERN, secure_id):
+        # Same rule as SECURE_ID_PATTERN but checked with the C-level string
+        # scans; isascii() narrows isalnum() down to exactly [a-zA-Z0-9].
+        if not (len(secure_id) >= 15
+                and secure_id.isascii() and secure_id.isalnum()):
             raise InvalidSecureIDError(
                 _("secure_id must be 15-character (or more) alphanumeric string"))
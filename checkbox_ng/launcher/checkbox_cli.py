@@ -21,32 +21,43 @@ Checkbox Launcher Interpreter Application
 """
 
 import gettext
+import importlib
 import logging
-import os
-import subprocess
+import socket
 import sys
 
-from plainbox.impl.jobcache import ResourceJobCache
-from plainbox.impl.launcher import DefaultLauncherDefinition
-from plainbox.impl.launcher import LauncherDefinition
-from plainbox.impl.session.assistant import SessionAssistant
-
-from checkbox_ng.config import load_configs
-from checkbox_ng.launcher.subcommands import (
-    Launcher, List, Run, StartProvider, Submit, ListBootstrapped,
-    TestPlanExport
-)
-from checkbox_ng.launcher.check_config import CheckConfig
-from checkbox_ng.launcher.merge_reports import MergeReports
-from checkbox_ng.launcher.merge_submissions import MergeSubmissions
-from checkbox_ng.launcher.master import RemoteMaster
-from checkbox_ng.launcher.slave import RemoteSlave
-
 
 _ = gettext.gettext
 
 _logger = logging.getLogger("checkbox-cli")
 
+# Mapping from subcommand name to the module and class implementing it.
+# The modules are imported lazily, once the subcommand to run is known,
+# so that `checkbox-cli --help` and simple subcommands don't pay for
+# importing every subcommand implementation (and its dependencies).
+_commands = {
+    'check-config': ('checkbox_ng.launcher.check_config', 'CheckConfig'),
+    'launcher': ('checkbox_ng.launcher.subcommands', 'Launcher'),
+    'list': ('checkbox_ng.launcher.subcommands', 'List'),
+    'run': ('checkbox_ng.launcher.subcommands', 'Run'),
+    'startprovider': ('checkbox_ng.launcher.subcommands', 'StartProvider'),
+    'submit': ('checkbox_ng.launcher.subcommands', 'Submit'),
+    'list-bootstrapped': (
+        'checkbox_ng.launcher.subcommands', 'ListBootstrapped'),
+    'merge-reports': ('checkbox_ng.launcher.merge_reports', 'MergeReports'),
+    'merge-submissions': (
+        'checkbox_ng.launcher.merge_submissions', 'MergeSubmissions'),
+    'tp-export': ('checkbox_ng.launcher.subcommands', 'TestPlanExport'),
+    'slave': ('checkbox_ng.launcher.slave', 'RemoteSlave'),
+    'master': ('checkbox_ng.launcher.master', 'RemoteMaster'),
+}
+
+
+def _load_command(name):
+    """Import and return the class implementing the given subcommand."""
+    module_name, class_name = _commands[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class Context:
     def __init__(self, args, sa):
@@ -55,21 +66,7 @@ class Context:
 
 def main():
     import argparse
-    commands = {
-        'check-config': CheckConfig,
-        'launcher': Launcher,
-        'list': List,
-        'run': Run,
-        'startprovider': StartProvider,
-        'submit': Submit,
-        'list-bootstrapped': ListBootstrapped,
-        'merge-reports': MergeReports,
-        'merge-submissions': MergeSubmissions,
-        'tp-export': TestPlanExport,
-        'slave': RemoteSlave,
-        'master': RemoteMaster,
-    }
-    known_cmds = list(commands.keys())
+    known_cmds = list(_commands.keys())
     known_cmds += ['-h', '--help']
     if not (set(known_cmds) & set(sys.argv[1:])):
         sys.argv.insert(1, 'launcher')
@@ -85,7 +82,7 @@ def main():
     top_parser.add_argument('--version', action='store_true', help=_(
         "show program's version information and exit"))
     top_parser.add_argument('subcommand', help=_("subcommand to run"),
-            choices=commands.keys())
+            choices=_commands.keys())
     # parse all the cli invocation until a subcommand is found
     # subcommand doesn't start with a '-'
     subcmd_index = 1
@@ -95,9 +92,13 @@ def main():
             break
     args = top_parser.parse_args(sys.argv[1:subcmd_index + 1])
     subcmd_parser = argparse.ArgumentParser()
-    subcmd = commands[args.subcommand]()
+    subcmd = _load_command(args.subcommand)()
     subcmd.register_arguments(subcmd_parser)
     sub_args = subcmd_parser.parse_args(sys.argv[subcmd_index + 1:])
+    # only import the plainbox machinery once we know the invocation is
+    # not going to end at argument parsing (--help, bad arguments, etc.)
+    from plainbox.impl.jobcache import ResourceJobCache
+    from plainbox.impl.session.assistant import SessionAssistant
     sa = SessionAssistant(
             "com.canonical:checkbox-cli",
             "0.99",
@@ -56,7 +56,7 @@ from plainbox.impl.session.restart import get_strategy_by_name
 from plainbox.impl.transport import TransportError
 from plainbox.impl.transport import InvalidSecureIDError
 from plainbox.impl.transport import get_all_transports
-from plainbox.impl.transport import SECURE_ID_PATTERN
+from plainbox.impl.transport import SECURE_ID_RE
 
 from checkbox_ng.config import load_configs
 from checkbox_ng.launcher.stages import MainLoopStage, ReportsStage
@@ -77,7 +77,7 @@ _logger = logging.getLogger("checkbox-ng.launcher.subcommands")
 class Submit():
     def register_arguments(self, parser):
         def secureid(secure_id):
-            if not re.match(SECURE_ID_PATTERN, secure_id):
+            if not SECURE_ID_RE.match(secure_id):
                 raise ArgumentTypeError(
                     _("must be 15-character (or more) alphanumeric string"))
             return secure_id
@@ -38,6 +38,7 @@ from plainbox.vendor.mock import MagicMock
 from requests.exceptions import ConnectionError, InvalidSchema, HTTPError
 import requests
 
+from checkbox_ng.certification import DEFAULT_TIMEOUT
 from checkbox_ng.certification import SubmissionServiceTransport
 
 
@@ -55,7 +56,7 @@ class SubmissionServiceTransportTests(TestCase):
         self.sample_archive = BytesIO(resource_string(
             "plainbox", "test-data/tar-exporter/example-data.tar.xz"
         ))
-        self.patcher = mock.patch('requests.post')
+        self.patcher = mock.patch('requests.Session.post')
         self.mock_requests = self.patcher.start()
 
     def test_parameter_parsing(self):
@@ -82,45 +83,48 @@ class SubmissionServiceTransportTests(TestCase):
         transport = SubmissionServiceTransport(
             self.invalid_url, self.valid_option_string)
         dummy_data = BytesIO(b"some data to send")
-        requests.post.side_effect = InvalidSchema
+        requests.Session.post.side_effect = InvalidSchema
 
         with self.assertRaises(TransportError):
             result = transport.send(dummy_data)
             self.assertIsNotNone(result)
-        requests.post.assert_called_with(
-            self.invalid_url, data=dummy_data, proxies=None)
+        requests.Session.post.assert_called_with(
+            self.invalid_url, data=dummy_data, proxies=None,
+            timeout=DEFAULT_TIMEOUT)
 
     @mock.patch('checkbox_ng.certification.logger')
     def test_valid_url_cant_connect(self, mock_logger):
         transport = SubmissionServiceTransport(
             self.unreachable_url, self.valid_option_string)
         dummy_data = BytesIO(b"some data to send")
-        requests.post.side_effect = ConnectionError
+        requests.Session.post.side_effect = ConnectionError
         with self.assertRaises(TransportError):
             result = transport.send(dummy_data)
             self.assertIsNotNone(result)
-        requests.post.assert_called_with(self.unreachable_url,
+        requests.Session.post.assert_called_with(self.unreachable_url,
                                          data=dummy_data,
-                                         proxies=None)
+                                         proxies=None,
+                                         timeout=DEFAULT_TIMEOUT)
 
     def test_send_success(self):
         transport = SubmissionServiceTransport(
             self.valid_url, self.valid_option_string)
-        requests.post.return_value = MagicMock(name='response')
-        requests.post.return_value.status_code = 200
-        requests.post.return_value.text = '{"id": 768}'
+        requests.Session.post.return_value = MagicMock(name='response')
+        requests.Session.post.return_value.status_code = 200
+        requests.Session.post.return_value.text = '{"id": 768}'
+        requests.Session.post.return_value.content = b'{"id": 768}'
         result = transport.send(self.sample_archive)
         self.assertTrue(result)
 
     def test_send_failure(self):
         transport = SubmissionServiceTransport(
             self.valid_url, self.valid_option_string)
-        requests.post.return_value = MagicMock(name='response')
-        requests.post.return_value.status_code = 412
-        requests.post.return_value.text = 'Some error'
+        requests.Session.post.return_value = MagicMock(name='response')
+        requests.Session.post.return_value.status_code = 412
+        requests.Session.post.return_value.text = 'Some error'
         # Oops, raise_for_status doesn't get fooled by my mocking,
         # so I have to mock *that* method as well..
-        requests.post.return_value.raise_for_status = MagicMock(
+        requests.Session.post.return_value.raise_for_status = MagicMock(
             side_effect=HTTPError)
         with self.assertRaises(TransportError):
             transport.send(self.sample_archive)
@@ -135,14 +139,15 @@ class SubmissionServiceTransportTests(TestCase):
             self.valid_url, self.valid_option_string)
         dummy_data = BytesIO(b"some data to send")
 
-        requests.post.return_value = MagicMock(name='response')
-        requests.post.return_value.status_code = 200
-        requests.post.return_value.text = '{"id": 768}'
+        requests.Session.post.return_value = MagicMock(name='response')
+        requests.Session.post.return_value.status_code = 200
+        requests.Session.post.return_value.text = '{"id": 768}'
+        requests.Session.post.return_value.content = b'{"id": 768}'
         result = transport.send(dummy_data, config=test_config)
         self.assertTrue(result)
-        requests.post.assert_called_with(
+        requests.Session.post.assert_called_with(
             self.valid_url, data=dummy_data,
-            proxies=test_proxies)
+            proxies=test_proxies, timeout=DEFAULT_TIMEOUT)
 
     def test_set_only_one_proxy(self):
         test_environment = {'http_proxy': "http://1.2.3.4:5"}
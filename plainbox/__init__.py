@@ -24,12 +24,17 @@ Simple checkbox (2008 version) redesign, without the complex message passing
 All abstract base classes are in :mod:`plainbox.abc`.
 """
 
+from functools import lru_cache
+
 # PEP440 compliant version declaration.
 #
 # This is used by @public decorator to enforce our public API guarantees.
 __version__ = '1.7.0.dev0'
 
+@lru_cache(maxsize=1)
 def get_version_string():
+    # The version string only depends on the environment (which does not
+    # change within one process), so compute it once and cache the result.
     import os
     version_string = ''
     if os.environ.get('SNAP_NAME'):
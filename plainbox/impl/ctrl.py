@@ -338,9 +338,9 @@ def gen_rfc822_records_from_io_log(job, result):
     """
     logger.debug(_("processing output from a job: %r"), job)
     # Select all stdout lines from the io log
-    line_gen = (record[2].decode('UTF-8', errors='replace')
+    line_gen = (record.data.decode('UTF-8', errors='replace')
                 for record in result.get_io_log()
-                if record[1] == 'stdout')
+                if record.stream_name == 'stdout')
     # Allow the generated records to be traced back to the job that defined
     # the command which produced (printed) them.
     source = JobOutputTextSource(job)
@@ -74,7 +74,7 @@ class SessionStateExporterBase(ISessionStateExporter):
     OPTION_FLATTEN_IO_LOG = 'flatten-io-log'
     OPTION_WITH_RUN_LIST = 'with-run-list'
     OPTION_WITH_JOB_LIST = 'with-job-list'
-    OPTION_WITH_DESIRED_JOB_LIST = 'with-job-list'
+    OPTION_WITH_DESIRED_JOB_LIST = 'with-desired-job-list'
     OPTION_WITH_RESOURCE_MAP = 'with-resource-map'
     OPTION_WITH_JOB_DEFS = 'with-job-defs'
     OPTION_WITH_ATTACHMENTS = 'with-attachments'
@@ -89,6 +89,7 @@ class SessionStateExporterBase(ISessionStateExporter):
         OPTION_FLATTEN_IO_LOG,
         OPTION_WITH_RUN_LIST,
         OPTION_WITH_JOB_LIST,
+        OPTION_WITH_DESIRED_JOB_LIST,
         OPTION_WITH_RESOURCE_MAP,
         OPTION_WITH_JOB_DEFS,
         OPTION_WITH_ATTACHMENTS,
@@ -206,15 +207,19 @@ class SessionStateExporterBase(ISessionStateExporter):
         data = {
             'result_map': {}
         }
+        # The _option_list property re-builds a sorted list on every access
+        # and this method tests membership in it several times per job, so
+        # snapshot it once as a frozenset for O(1) lookups.
+        option_list = frozenset(self._option_list)
         session = session_manager.state
-        if self.OPTION_WITH_JOB_LIST in self._option_list:
+        if self.OPTION_WITH_JOB_LIST in option_list:
             data['job_list'] = [job.id for job in session.job_list]
-        if self.OPTION_WITH_RUN_LIST in self._option_list:
+        if self.OPTION_WITH_RUN_LIST in option_list:
             data['run_list'] = [job.id for job in session.run_list]
-        if self.OPTION_WITH_DESIRED_JOB_LIST in self._option_list:
+        if self.OPTION_WITH_DESIRED_JOB_LIST in option_list:
             data['desired_job_list'] = [job.id
                                         for job in session.desired_job_list]
-        if self.OPTION_WITH_RESOURCE_MAP in self._option_list:
+        if self.OPTION_WITH_RESOURCE_MAP in option_list:
             data['resource_map'] = {
                 # TODO: there is no method to get all data from a Resource
                 # instance and there probably should be. Or just let there be
@@ -227,9 +232,9 @@ class SessionStateExporterBase(ISessionStateExporter):
                 for resource_name, resource_list
                 in session._resource_map.items()
             }
-        if self.OPTION_WITH_ATTACHMENTS in self._option_list:
+        if self.OPTION_WITH_ATTACHMENTS in option_list:
             data['attachment_map'] = {}
-        if self.OPTION_WITH_CATEGORY_MAP in self._option_list:
+        if self.OPTION_WITH_CATEGORY_MAP in option_list:
             wanted_category_ids = frozenset({
                 job_state.effective_category_id
                 for job_state in session.job_state_map.values()
@@ -245,69 +250,79 @@ class SessionStateExporterBase(ISessionStateExporter):
             UNCATEGORISED = 'com.canonical.plainbox::uncategorised'
             if UNCATEGORISED in wanted_category_ids:
                 data['category_map'][UNCATEGORISED] = _("Uncategorised")
+        # The loop below runs once per job so hoist the option tests and the
+        # result_map lookup out of it; inside the loop keep the job and the
+        # result in locals instead of re-walking job_state attributes.
+        result_map = data['result_map']
+        with_comments = self.OPTION_WITH_COMMENTS in option_list
+        with_job_hash = self.OPTION_WITH_JOB_HASH in option_list
+        with_job_defs = self.OPTION_WITH_JOB_DEFS in option_list
+        with_attachments = self.OPTION_WITH_ATTACHMENTS in option_list
+        with_io_log = self.OPTION_WITH_IO_LOG in option_list
+        squash_io_log = self.OPTION_SQUASH_IO_LOG in option_list
+        flatten_io_log = self.OPTION_FLATTEN_IO_LOG in option_list
+        with_certification_status = (
+            self.OPTION_WITH_CERTIFICATION_STATUS in option_list)
         for job_id, job_state in session.job_state_map.items():
-            if job_state.result.outcome is None:
+            job = job_state.job
+            result = job_state.result
+            if result.outcome is None:
                 continue
-            data['result_map'][job_id] = OrderedDict()
-            data['result_map'][job_id]['summary'] = job_state.job.tr_summary()
-            data['result_map'][job_id]['category_id'] = \
-                job_state.effective_category_id
-            data['result_map'][job_id]['outcome'] = job_state.result.outcome
-            if job_state.result.execution_duration:
-                data['result_map'][job_id]['execution_duration'] = \
-                    job_state.result.execution_duration
-            if self.OPTION_WITH_COMMENTS in self._option_list:
-                data['result_map'][job_id]['comments'] = \
-                    job_state.result.comments
+            entry = result_map[job_id] = OrderedDict()
+            entry['summary'] = job.tr_summary()
+            entry['category_id'] = job_state.effective_category_id
+            entry['outcome'] = result.outcome
+            if result.execution_duration:
+                entry['execution_duration'] = result.execution_duration
+            if with_comments:
+                entry['comments'] = result.comments
 
             # Add Job hash if requested
-            if self.OPTION_WITH_JOB_HASH in self._option_list:
-                data['result_map'][job_id]['hash'] = job_state.job.checksum
+            if with_job_hash:
+                entry['hash'] = job.checksum
 
             # Add Job definitions if requested
-            if self.OPTION_WITH_JOB_DEFS in self._option_list:
+            if with_job_defs:
                 for prop in ('plugin',
                              'requires',
                              'depends',
                              'command',
                              'description',
                              ):
-                    if not getattr(job_state.job, prop):
+                    value = getattr(job, prop)
+                    if not value:
                         continue
-                    data['result_map'][job_id][prop] = getattr(
-                        job_state.job, prop)
+                    entry[prop] = value
 
             # Add Attachments if requested
-            if job_state.job.plugin == 'attachment':
-                if self.OPTION_WITH_ATTACHMENTS in self._option_list:
+            if job.plugin == 'attachment':
+                if with_attachments:
                     self._build_attachment_map(data, job_id, job_state)
                 continue  # Don't add attachments IO logs to the result_map
 
             # Add IO log if requested
-            if self.OPTION_WITH_IO_LOG in self._option_list:
+            if with_io_log:
                 # If requested, squash the IO log so that only textual data is
                 # saved, discarding stream name and the relative timestamp.
-                if self.OPTION_SQUASH_IO_LOG in self._option_list:
-                    io_log_data = self._squash_io_log(
-                        job_state.result.get_io_log())
-                elif self.OPTION_FLATTEN_IO_LOG in self._option_list:
-                    io_log_data = self._flatten_io_log(
-                        job_state.result.get_io_log())
+                if squash_io_log:
+                    io_log_data = self._squash_io_log(result.get_io_log())
+                elif flatten_io_log:
+                    io_log_data = self._flatten_io_log(result.get_io_log())
                 else:
-                    io_log_data = self._io_log(job_state.result.get_io_log())
-                data['result_map'][job_id]['io_log'] = io_log_data
+                    io_log_data = self._io_log(result.get_io_log())
+                entry['io_log'] = io_log_data
 
             # Add certification status if requested
-            if self.OPTION_WITH_CERTIFICATION_STATUS in self._option_list:
-                data['result_map'][job_id]['certification_status'] = (
+            if with_certification_status:
+                entry['certification_status'] = (
                     job_state.effective_certification_status)
         return data
 
     def _build_attachment_map(self, data, job_id, job_state):
         raw_bytes = b''.join(
-            (record[2] for record in
+            (record.data for record in
              job_state.result.get_io_log()
-             if record[1] == 'stdout'))
+             if record.stream_name == 'stdout'))
         data['attachment_map'][job_id] = \
             base64.standard_b64encode(raw_bytes).decode('ASCII')
 
@@ -322,9 +337,11 @@ class SessionStateExporterBase(ISessionStateExporter):
     @classmethod
     def _flatten_io_log(cls, io_log):
         # Similar to squash but also coalesce all records into one big base64
-        # string (there are no arrays / lists anymore)
+        # string (there are no arrays / lists anymore). Feed join() straight
+        # from the record stream so no intermediate list of data chunks is
+        # materialized next to the joined result.
         return base64.standard_b64encode(
-            b''.join([record.data for record in io_log])
+            b''.join(record.data for record in io_log)
         ).decode('ASCII')
 
     @classmethod
@@ -46,6 +46,13 @@ from plainbox.impl.unit.exporter import ExporterError
 #: Name-space prefix for Canonical Certification
 CERTIFICATION_NS = 'com.canonical.certification::'
 
+#: Cache of jinja2 Environment objects, keyed by exporter class and template
+#: search path. Creating an environment and compiling templates is costly and
+#: the result depends only on the key, so exporters instantiated repeatedly
+#: for the same exporter unit share one environment (and its internal cache
+#: of compiled templates).
+_env_cache = {}
+
 
 @environmentfilter
 def do_strip_ns(_environment, unit_id, ns=CERTIFICATION_NS):
@@ -108,16 +115,21 @@ class Jinja2SessionStateExporter(SessionStateExporterBase):
         if "extra_paths" in self.data:
             paths.extend(self.data["extra_paths"])
         self.option_list = exporter_unit.option_list
-        loader = FileSystemLoader(paths)
-        env = Environment(loader=loader, extensions=['jinja2.ext.autoescape'])
-        self.customize_environment(env)
-
-        def include_file(name):
-            # This helper function insert static files literally into Jinja
-            # templates without parsing them.
-            return Markup(loader.get_source(env, name)[0])
-
-        env.globals['include_file'] = include_file
+        env_key = (type(self), tuple(paths))
+        env = _env_cache.get(env_key)
+        if env is None:
+            loader = FileSystemLoader(paths)
+            env = Environment(
+                loader=loader, extensions=['jinja2.ext.autoescape'])
+            self.customize_environment(env)
+
+            def include_file(name):
+                # This helper function insert static files literally into
+                # Jinja templates without parsing them.
+                return Markup(loader.get_source(env, name)[0])
+
+            env.globals['include_file'] = include_file
+            _env_cache[env_key] = env
         self.template = env.get_template(exporter_unit.template)
 
     @property
@@ -152,6 +152,24 @@ class SessionStateExporterBaseTests(TestCase):
         }
         self.assertEqual(data, expected_data)
 
+    def test_job_list_options_are_distinct(self):
+        # Regression test: OPTION_WITH_DESIRED_JOB_LIST used to share the
+        # 'with-job-list' string with OPTION_WITH_JOB_LIST so each option
+        # toggled the other one's key. Check that each option only adds
+        # its own key to the output.
+        session_manager = mock.Mock(spec_set=SessionManager,
+                                    state=self.make_test_session())
+        exporter = self.TestSessionStateExporter(
+            [SessionStateExporterBase.OPTION_WITH_JOB_LIST])
+        data = exporter.get_session_data_subset(session_manager)
+        self.assertIn('job_list', data)
+        self.assertNotIn('desired_job_list', data)
+        exporter = self.TestSessionStateExporter(
+            [SessionStateExporterBase.OPTION_WITH_DESIRED_JOB_LIST])
+        data = exporter.get_session_data_subset(session_manager)
+        self.assertIn('desired_job_list', data)
+        self.assertNotIn('job_list', data)
+
     def make_realistic_test_session(self, session_dir):
         # Create a more realistic session with two jobs but with richer set
         # of data in the actual jobs and results.
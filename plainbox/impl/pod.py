@@ -282,6 +282,12 @@ class Field:
         self.name = name
         self.instance_attr = "_{}".format(name)
         self.signal_name = "on_{}_changed".format(name)
+        # Specialize assignment for the common case. Whether a field has
+        # assign filters or change notification is fixed by the time the
+        # containing class is created, so decide once here instead of
+        # re-checking on every single assignment in __set__().
+        self.needs_slow_assign = (
+            self.assign_filter_list is not None or self.notify)
 
     def alter_cls(self, cls: type) -> None:
         """
@@ -329,8 +335,12 @@ class Field:
         This can be used to implement simple type checking, value checking or
         even type and value conversions.
         """
-        if self.assign_filter_list is not None or self.notify:
-            old_value = getattr(instance, self.instance_attr, UNSET)
+        if not self.needs_slow_assign:
+            # Fast path: no assign filters and no change notification, the
+            # assignment is a plain attribute store.
+            setattr(instance, self.instance_attr, new_value)
+            return
+        old_value = getattr(instance, self.instance_attr, UNSET)
         # Run the value through assign filters
         if self.assign_filter_list is not None:
             for assign_filter in self.assign_filter_list:
@@ -420,7 +420,7 @@ class _JobResultBase(IJobResult):
                 CONTROL_CODE_RE_STR.sub('', text_chunk)
                 for text_chunk in codecs.iterdecode(
                     (record.data for record in self.get_io_log()
-                        if record[1] == 'stdout'), 'UTF-8'))
+                        if record.stream_name == 'stdout'), 'UTF-8'))
         except UnicodeDecodeError:
             return ''
 
@@ -507,12 +507,9 @@ class DiskJobResult(_JobResultBase):
         if record_path:
             with gzip.GzipFile(record_path, mode='rb') as gzip_stream, \
                     io.TextIOWrapper(gzip_stream, encoding='UTF-8') as stream:
-                for record in IOLogRecordReader(stream):
-                    record = IOLogRecord(
-                        record[0],
-                        record[1],
-                        record.data)
-                    yield record
+                # the reader already produces IOLogRecord instances so
+                # there is no need to re-wrap them record by record
+                yield from IOLogRecordReader(stream)
 
     @property
     def io_log(self):
@@ -541,7 +538,8 @@ class IOLogRecordWriter:
             base64.standard_b64encode(record[2]).decode("ASCII")],
             check_circular=False, ensure_ascii=True, indent=None,
             separators=(',', ':'))
-        logger.debug(_("Encoded %r into string %r"), record, text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(_("Encoded %r into string %r"), record, text)
         assert "\n" not in text
         self.stream.write(text)
         self.stream.write('\n')
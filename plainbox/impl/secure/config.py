@@ -148,6 +148,7 @@ class Variable(INameTracking):
         self._default = default
         self._validator_list = validator_list
         self._help_text = help_text
+        self._update_mangled_name()
         # Workaround for Sphinx breaking if __doc__ is a property
         self.__doc__ = self.help_text or self.__class__.__doc__
 
@@ -180,6 +181,14 @@ class Variable(INameTracking):
         """
         if self._name is None:
             self._name = name
+            self._update_mangled_name()
+
+    def _update_mangled_name(self):
+        # Both the section and the name are fixed once the Config class is
+        # created so the mangled name is computed eagerly here; computing it
+        # inside __get__() would re-format the same string on every single
+        # read of every configuration variable.
+        self._mangled_name = "{}__{}".format(self._section, self._name)
 
     @property
     def name(self):
@@ -194,7 +203,7 @@ class Variable(INameTracking):
         name prefixed by the name of the section name and '__' to resolve
         conflicts between same name  variables living in different sections
         """
-        return "{}__{}".format(self._section, self._name)
+        return self._mangled_name
 
     @property
     def section(self):
@@ -244,7 +253,7 @@ class Variable(INameTracking):
         if instance is None:
             return self
         try:
-            return instance._get_variable(self.mangled_name)
+            return instance._get_variable(self._mangled_name)
         except KeyError:
             return self.default
 
@@ -257,13 +266,13 @@ class Variable(INameTracking):
         # Check it against all validators
         self.validate(new_value)
         # Assign it to the backing store of the instance
-        instance._set_variable(self.mangled_name, new_value)
+        instance._set_variable(self._mangled_name, new_value)
 
     def __delete__(self, instance):
         # NOTE: this is quite confusing, this method is a companion to __get__
         # and __set__ but __del__ is entirely unrelated (object garbage
         # collected, do final cleanup) so don't think this is a mistake
-        instance._del_variable(self.mangled_name)
+        instance._del_variable(self._mangled_name)
 
 
 class Section(INameTracking):
@@ -499,7 +499,10 @@ class PkgResourcesPlugInCollection(PlugInCollectionBase):
             try:
                 obj = entry_point.load()
             except ImportError as exc:
-                logger.exception(_("Unable to import %s"), entry_point)
+                # Formatting the traceback is not free so only do it when
+                # something is actually going to log it.
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.exception(_("Unable to import %s"), entry_point)
                 self._problem_list.append(exc)
             else:
                 self.wrap_and_add_plugin(
@@ -735,7 +738,8 @@ class LazyPlugInCollection(PlugInCollectionBase):
             logger.debug(_("Loading %r"), name)
             obj = self.do_load_one(name, discovery_data)
         except (ImportError, AttributeError, ValueError) as exc:
-            logger.exception(_("Unable to load: %r"), name)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception(_("Unable to load: %r"), name)
             self._problem_list.append(exc)
         else:
             logger.debug(_("Wrapping %r"), name)
@@ -31,6 +31,7 @@ Implementation of rfc822 serializer and deserializer.
 
 import logging
 import re
+import sys
 import textwrap
 
 from plainbox.i18n import gettext as _
@@ -267,6 +268,10 @@ def gen_rfc822_records(stream, data_cls=dict, source=None):
     value_list = None
     origin = None
     field_offset_map = None
+    # This generator is called once per line of every unit definition file so
+    # even preparing the arguments for a suppressed logger.debug() call (the
+    # gettext lookup in particular) is measurable. Check the level once.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     # If the source was not provided then try constructing a FileTextSource
     # from the name of the stream. If that fails, keep using None.
     if source is None:
@@ -311,7 +316,9 @@ def gen_rfc822_records(stream, data_cls=dict, source=None):
             normalized_value = normalize_rfc822_value(raw_value)
             record.raw_data[key] = raw_value
             record.data[key] = normalized_value
-            logger.debug(_("Committed key/value %r=%r"), key, normalized_value)
+            if debug_enabled:
+                logger.debug(
+                    _("Committed key/value %r=%r"), key, normalized_value)
             key = None
 
     def _set_start_lineno_if_needed():
@@ -336,7 +343,8 @@ def gen_rfc822_records(stream, data_cls=dict, source=None):
         stream = iter(stream.splitlines(True))
     # Iterate over subsequent lines of the stream
     for lineno, line in enumerate(stream, start=1):
-        logger.debug(_("Looking at line %d:%r"), lineno, line)
+        if debug_enabled:
+            logger.debug(_("Looking at line %d:%r"), lineno, line)
         # Treat # as comments
         if line.startswith("#"):
             pass
@@ -348,7 +356,8 @@ def gen_rfc822_records(stream, data_cls=dict, source=None):
             # If data is non-empty, yield the record, this allows us to safely
             # use newlines for formatting
             if record.data:
-                logger.debug(_("yielding record: %r"), record)
+                if debug_enabled:
+                    logger.debug(_("yielding record: %r"), record)
                 yield record
             # Reset local state so that we can build a new record
             _new_record()
@@ -380,7 +389,10 @@ def gen_rfc822_records(stream, data_cls=dict, source=None):
             # all surrounding whitespace from the key and getting rid of the
             # leading whitespace from the value.
             key, value = line.split(":", 1)
-            key = key.strip()
+            # Fields like "id" or "command" recur in every record of every
+            # unit file and end up as dictionary keys all over the stack, so
+            # intern them; interned keys hash once and compare by pointer.
+            key = sys.intern(key.strip())
             value = value.lstrip()
             # Check if the key already exist in this message
             if key in record.data:
@@ -416,5 +428,6 @@ def gen_rfc822_records(stream, data_cls=dict, source=None):
     _commit_key_value_if_needed()
     # Once we've seen the whole file return the last record, if any
     if record.data:
-        logger.debug(_("yielding record: %r"), record)
+        if debug_enabled:
+            logger.debug(_("yielding record: %r"), record)
         yield record
@@ -39,6 +39,7 @@ from plainbox.impl.ctrl import gen_rfc822_records_from_io_log
 from plainbox.impl.job import JobDefinition
 from plainbox.impl.resource import Resource
 from plainbox.impl.resource import ResourceExpression
+from plainbox.impl.result import IOLogRecord
 from plainbox.impl.result import MemoryJobResult
 from plainbox.impl.secure.origin import JobOutputTextSource
 from plainbox.impl.secure.origin import Origin
@@ -289,9 +290,9 @@ class CheckBoxSessionStateControllerTests(TestCase):
         job = mock.Mock(spec=JobDefinition, plugin='resource')
         result = mock.Mock(spec=IJobResult, outcome=IJobResult.OUTCOME_PASS)
         result.get_io_log.return_value = [
-            (0, 'stdout', b'attr: value1\n'),
-            (0, 'stdout', b'\n'),
-            (0, 'stdout', b'attr: value2\n')]
+            IOLogRecord(0, 'stdout', b'attr: value1\n'),
+            IOLogRecord(0, 'stdout', b'\n'),
+            IOLogRecord(0, 'stdout', b'attr: value2\n')]
         session_state = mock.MagicMock(spec=SessionState)
         self.ctrl.observe_result(session_state, job, result)
         # Ensure that result got stored
@@ -310,7 +311,7 @@ class CheckBoxSessionStateControllerTests(TestCase):
     def test_observe_result__broken_resource(self, mock_logger):
         job = mock.Mock(spec=JobDefinition, plugin='resource')
         result = mock.Mock(spec=IJobResult, outcome=IJobResult.OUTCOME_PASS)
-        result.get_io_log.return_value = [(0, 'stdout', b'barf\n')]
+        result.get_io_log.return_value = [IOLogRecord(0, 'stdout', b'barf\n')]
         session_state = mock.MagicMock(spec=SessionState)
         self.ctrl.observe_result(session_state, job, result)
         # Ensure that result got stored
@@ -335,9 +336,9 @@ class CheckBoxSessionStateControllerTests(TestCase):
             'plugin': 'shell'})
         result = mock.Mock(spec=IJobResult, outcome=IJobResult.OUTCOME_PASS)
         result.get_io_log.return_value = [
-            (0, 'stdout', b'attr: value1\n'),
-            (0, 'stdout', b'\n'),
-            (0, 'stdout', b'attr: value2\n')]
+            IOLogRecord(0, 'stdout', b'attr: value1\n'),
+            IOLogRecord(0, 'stdout', b'\n'),
+            IOLogRecord(0, 'stdout', b'attr: value2\n')]
         session_state = SessionState([template, job])
         self.ctrl.observe_result(session_state, job, result)
         # Ensure that a warning was logged
@@ -359,9 +360,9 @@ class FunctionTests(TestCase):
         job = mock.Mock(spec=JobDefinition)
         result = mock.Mock(spec=IJobResult)
         result.get_io_log.return_value = [
-            (0, 'stdout', b'attr: value1\n'),
-            (0, 'stdout', b'\n'),
-            (0, 'stdout', b'attr: value2\n')]
+            IOLogRecord(0, 'stdout', b'attr: value1\n'),
+            IOLogRecord(0, 'stdout', b'\n'),
+            IOLogRecord(0, 'stdout', b'attr: value2\n')]
         # Parse the IO log records
         records = list(gen_rfc822_records_from_io_log(job, result))
         # Ensure that we saw both records
@@ -378,11 +379,11 @@ class FunctionTests(TestCase):
         job = mock.Mock(spec=JobDefinition)
         result = mock.Mock(spec=IJobResult)
         result.get_io_log.return_value = [
-            (0, 'stdout', b'attr: value1\n'),
-            (0, 'stdout', b'\n'),
-            (0, 'stdout', b'error\n'),
-            (0, 'stdout', b'\n'),
-            (0, 'stdout', b'attr: value2\n')]
+            IOLogRecord(0, 'stdout', b'attr: value1\n'),
+            IOLogRecord(0, 'stdout', b'\n'),
+            IOLogRecord(0, 'stdout', b'error\n'),
+            IOLogRecord(0, 'stdout', b'\n'),
+            IOLogRecord(0, 'stdout', b'attr: value2\n')]
         # Parse the IO log records
         records = list(gen_rfc822_records_from_io_log(job, result))
         # Ensure that only the first record was generated
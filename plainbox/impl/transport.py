@@ -28,6 +28,7 @@ Shared code for test data transports..
     THIS MODULE DOES NOT HAVE STABLE PUBLIC API
 """
 
+import logging
 from collections import OrderedDict
 from io import TextIOWrapper
 from logging import getLogger
@@ -41,7 +42,10 @@ from plainbox.i18n import gettext as _
 from plainbox.impl.exporter import ByteStringStreamTranslator
 from plainbox.impl.secure.config import Unset
 
-import requests
+# NOTE: requests (and the optional requests_toolbelt) are imported lazily in
+# _OAuthTransport.send(); this module is pulled in during CLI start-up and
+# importing requests there costs tens of milliseconds of urllib3/chardet
+# imports that most invocations never need.
 
 # OAuth is not always available on all platforms.
 _oauth_available = True
@@ -111,6 +115,10 @@ class TransportBase(ISessionStateTransport):
 
 SECURE_ID_PATTERN = r"^[a-zA-Z0-9]{15,}$"
 
+#: Compiled form of :data:`SECURE_ID_PATTERN`; validators should prefer this
+#: over re-compiling (or re-looking-up) the pattern on each check.
+SECURE_ID_RE = re.compile(SECURE_ID_PATTERN)
+
 
 class InvalidSecureIDError(ValueError):
 
@@ -118,12 +126,11 @@ class InvalidSecureIDError(ValueError):
 
     def __init__(self, value):
         """Initialize a new exception."""
+        # Let ValueError carry the message in args so str() works without a
+        # custom __str__ taking a detour through repr().
+        super().__init__(value)
         self.value = value
 
-    def __str__(self):
-        """Get a string representation."""
-        return repr(self.value)
-
 
 def oauth_available():
     return _oauth_available
@@ -144,6 +151,13 @@ class _OAuthTransport(TransportBase):
         self.uploader_email = transport_details['uploader_email']
 
     def send(self, data, config=None, session_state=None):
+        import requests
+        # requests_toolbelt is optional; when present, multipart bodies are
+        # streamed chunk by chunk instead of being buffered in memory.
+        try:
+            from requests_toolbelt import MultipartEncoder
+        except ImportError:
+            MultipartEncoder = None
         headers = {}
         if self.oauth_creds:
             client = oauth1.Client(
@@ -157,24 +171,36 @@ class _OAuthTransport(TransportBase):
             # The uri is unchanged from self.url, it's the headers we're
             # interested in.
             uri, headers, body = client.sign(self.url, 'POST')
-        form_payload = dict(data=data)
-        form_data = dict(uploader_email=self.uploader_email)
+        if MultipartEncoder is not None:
+            # Stream the multipart body; passing a file-like object through
+            # files= would make requests read the whole submission into
+            # memory before transmitting anything.
+            encoder = MultipartEncoder(fields={
+                'uploader_email': self.uploader_email,
+                'data': ('data', data, 'application/octet-stream'),
+            })
+            headers['Content-Type'] = encoder.content_type
+            post_kwargs = dict(data=encoder, headers=headers)
+        else:
+            post_kwargs = dict(
+                files=dict(data=data),
+                data=dict(uploader_email=self.uploader_email),
+                headers=headers)
         try:
-            response = requests.post(
-                self.url, files=form_payload, data=form_data, headers=headers)
+            response = requests.post(self.url, **post_kwargs)
         except requests.exceptions.Timeout as exc:
             raise TransportError('Request to timed out: {}'.format(exc))
         except requests.exceptions.InvalidSchema as exc:
             raise TransportError('Invalid destination URL: {0}'.format(exc))
         except requests.exceptions.ConnectionError as exc:
             raise TransportError('Unable to connect: {0}'.format(exc))
-        if response is not None:
-            try:
-                # This will raise HTTPError for status != 20x
-                response.raise_for_status()
-            except requests.exceptions.RequestException as exc:
-                raise TransportError(str(exc))
-
+        # post() either returns a response or raises (handled above) so there
+        # is no None case to guard against.
+        try:
+            # This will raise HTTPError for status != 20x
+            response.raise_for_status()
+        except requests.exceptions.RequestException as exc:
+            raise TransportError(str(exc))
         return dict(message='Upload successful.', status=response.status_code)
 
 
@@ -247,19 +273,33 @@ else:
     OAuthTransport = NoOauthTransport
 
 
+#: Cached result of :func:`get_all_transports()`
+_transport_map = None
+
+
 def get_all_transports():
     """
     Discover and load all transport classes.
 
     Returns a map of transports (mapping from name to transport class)
+
+    The set of available transports cannot change at runtime so the
+    entry-point scan and the import of each transport module is done once
+    and the resulting map is cached; callers (the submit flow in
+    particular) invoke this function several times per session.
     """
+    global _transport_map
+    if _transport_map is not None:
+        return _transport_map
     transport_map = OrderedDict()
     iterator = pkg_resources.iter_entry_points('plainbox.transport')
     for entry_point in sorted(iterator, key=lambda ep: ep.name):
         try:
             transport_cls = entry_point.load()
-        except ImportError as exc:
-            logger.exception(_("Unable to import {}: {}"), entry_point, exc)
+        except ImportError:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception(_("Unable to import %s"), entry_point)
         else:
             transport_map[entry_point.name] = transport_cls
+    _transport_map = transport_map
     return transport_map
@@ -29,6 +29,11 @@ from jinja2 import Environment, meta
 
 __all__ = ['get_accessed_parameters', 'all_unit']
 
+#: Shared empty result of :func:`get_accessed_parameters()`. Most fields
+#: access no parameters at all so share one immutable empty set instead of
+#: allocating a fresh one per field per call.
+_EMPTY_FROZENSET = frozenset()
+
 
 def get_accessed_parameters(text, template_engine='default'):
     """
@@ -41,7 +46,9 @@ def get_accessed_parameters(text, template_engine='default'):
     """
     if template_engine == 'jinja2':
         env = Environment()
-        return frozenset(meta.find_undeclared_variables(env.parse(text)))
+        return frozenset(
+            meta.find_undeclared_variables(env.parse(text))
+        ) or _EMPTY_FROZENSET
     else:
     # https://docs.python.org/3.4/library/string.html#string.Formatter.parse
     #
@@ -50,7 +57,7 @@ def get_accessed_parameters(text, template_engine='default'):
     # parameters used
         return frozenset(
             info[1] for info in string.Formatter().parse(text)
-            if info[1] is not None)
+            if info[1] is not None) or _EMPTY_FROZENSET
 
 
 # Collection of all unit classes
@@ -291,12 +291,12 @@ class JobDefinition(UnitWithId, IJobDefinition):
         description = self.get_record_value('description')
         if description is None:
             # try combining purpose/steps/verification fields
-            description = ""
+            parts = []
             for stage in ['purpose', 'steps', 'verification']:
                 stage_value = self.get_record_value(stage)
                 if stage_value is not None:
-                    description += stage.upper() + ':\n' + stage_value + '\n'
-            description = description.strip()
+                    parts.append(stage.upper() + ':\n' + stage_value + '\n')
+            description = ''.join(parts).strip()
             if not description:
                 # combining new description yielded empty string
                 description = None
@@ -480,13 +480,12 @@ class JobDefinition(UnitWithId, IJobDefinition):
                 'steps': _('STEPS'),
                 'verification': _('VERIFICATION')
             }
-            tr_description = ""
+            parts = []
             for stage in ['purpose', 'steps', 'verification']:
                 stage_value = self.get_translated_record_value(stage)
                 if stage_value is not None:
-                    tr_description += (tr_stages[stage] + ':\n' +
-                                       stage_value + '\n')
-            tr_description = tr_description.strip()
+                    parts.append(tr_stages[stage] + ':\n' + stage_value + '\n')
+            tr_description = ''.join(parts).strip()
             if not tr_description:
                 # combining new description yielded empty string
                 tr_description = None
@@ -82,13 +82,31 @@ class IssueMixIn:
 
 class TestUnitDefinition(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared, read-only reference units. Several tests below only read
+        # from them so there is no point in re-building the same six units
+        # for each test; anything that mutates a unit builds its own.
+        cls.unit_kv = Unit({'key': 'value'}, {'key': 'raw-value'})
+        cls.unit_hidden_kv = Unit({'_key': 'value'}, {'_key': 'raw-value'})
+        cls.unit_param = Unit(
+            {'key': '{param}'}, {'key': 'raw-{param}'},
+            parameters={'param': 'value'})
+        cls.unit_missing_param = Unit(
+            {'key': '{missing_param}'}, {'key': 'raw-{missing_param}'},
+            parameters={'param': 'value'})
+        cls.unit_empty = Unit({})
+        cls.unit_empty_param = Unit({}, parameters={'param': 'value'})
+
     def test_instantiate_template(self):
-        data = mock.Mock(name='data')
-        raw_data = mock.Mock(name='raw_data')
-        origin = mock.Mock(name='origin')
-        provider = mock.Mock(name='provider')
-        parameters = mock.Mock(name='parameters')
-        field_offset_map = mock.Mock(name='field_offset_map')
+        # Plain sentinels are enough here, the test only checks that each
+        # argument ends up stored on the right attribute.
+        data = object()
+        raw_data = object()
+        origin = object()
+        provider = object()
+        parameters = object()
+        field_offset_map = object()
         unit = Unit.instantiate_template(
             data, raw_data, origin, provider, parameters, field_offset_map)
         self.assertIs(unit._data, data)
@@ -98,61 +116,53 @@ class TestUnitDefinition(TestCase):
         self.assertIs(unit._parameters, parameters)
         self.assertIs(unit._field_offset_map, field_offset_map)
 
+    def _value_cases(self):
+        # Units with a 'key' field and the value / raw value expected from it
+        return [
+            (self.unit_kv, 'value', 'raw-value'),
+            (self.unit_hidden_kv, 'value', 'raw-value'),
+            (self.unit_param, 'value', 'raw-value'),
+        ]
+
     def test_get_raw_record_value(self):
         """
         Ensure that get_raw_record_value() works okay
         """
-        unit1 = Unit({'key': 'value'}, {'key': 'raw-value'})
-        unit2 = Unit({'_key': 'value'}, {'_key': 'raw-value'})
-        unit3 = Unit({'key': '{param}'}, {'key': 'raw-{param}'},
-                     parameters={'param': 'value'})
-        unit4 = Unit({'key': '{missing_param}'},
-                     {'key': 'raw-{missing_param}'},
-                     parameters={'param': 'value'})
-        unit5 = Unit({})
-        unit6 = Unit({}, parameters={'param': 'value'})
-        self.assertEqual(unit1.get_raw_record_value('key'), 'raw-value')
-        self.assertEqual(unit2.get_raw_record_value('key'), 'raw-value')
-        self.assertEqual(unit3.get_raw_record_value('key'), 'raw-value')
+        for unit, _, raw_value in self._value_cases():
+            with self.subTest(unit=unit):
+                self.assertEqual(unit.get_raw_record_value('key'), raw_value)
         with self.assertRaises(KeyError):
-            unit4.get_raw_record_value('key')
-        self.assertEqual(unit5.get_raw_record_value('key'), None)
-        self.assertEqual(
-            unit5.get_raw_record_value('key', 'default'), 'default')
-        self.assertEqual(unit6.get_raw_record_value('key'), None)
-        self.assertEqual(
-            unit6.get_raw_record_value('key', 'default'), 'default')
+            self.unit_missing_param.get_raw_record_value('key')
+        for unit in (self.unit_empty, self.unit_empty_param):
+            with self.subTest(unit=unit):
+                self.assertEqual(unit.get_raw_record_value('key'), None)
+                self.assertEqual(
+                    unit.get_raw_record_value('key', 'default'), 'default')
 
     def test_get_record_value(self):
         """
         Ensure that get_record_value() works okay
         """
-        unit1 = Unit({'key': 'value'}, {'key': 'raw-value'})
-        unit2 = Unit({'_key': 'value'}, {'_key': 'raw-value'})
-        unit3 = Unit({'key': '{param}'}, {'key': 'raw-{param}'},
-                     parameters={'param': 'value'})
-        unit4 = Unit({'key': '{missing_param}'},
-                     {'key': 'raw-{missing_param}'},
-                     parameters={'param': 'value'})
-        unit5 = Unit({})
-        unit6 = Unit({}, parameters={'param': 'value'})
-        self.assertEqual(unit1.get_record_value('key'), 'value')
-        self.assertEqual(unit2.get_record_value('key'), 'value')
-        self.assertEqual(unit3.get_record_value('key'), 'value')
+        for unit, value, _ in self._value_cases():
+            with self.subTest(unit=unit):
+                self.assertEqual(unit.get_record_value('key'), value)
         with self.assertRaises(MissingParam):
-            unit4.get_record_value('key')
-        self.assertEqual(unit5.get_record_value('key'), None)
-        self.assertEqual(unit5.get_record_value('key', 'default'), 'default')
-        self.assertEqual(unit6.get_record_value('key'), None)
-        self.assertEqual(unit6.get_record_value('key', 'default'), 'default')
+            self.unit_missing_param.get_record_value('key')
+        for unit in (self.unit_empty, self.unit_empty_param):
+            with self.subTest(unit=unit):
+                self.assertEqual(unit.get_record_value('key'), None)
+                self.assertEqual(
+                    unit.get_record_value('key', 'default'), 'default')
 
     def test_get_translated_data__typical(self):
         """
         Verify the runtime behavior of get_translated_data()
         """
         unit = Unit({})
-        with mock.patch.object(unit, "_provider") as mock_provider:
-            retval = unit.get_translated_data('foo')
+        # The unit is local so a plain attribute assignment is all the
+        # patching this needs.
+        mock_provider = unit._provider = mock.Mock()
+        retval = unit.get_translated_data('foo')
         mock_provider.get_translated_data.assert_called_with("foo")
         self.assertEqual(retval, mock_provider.get_translated_data())
 
@@ -169,16 +179,16 @@ class TestUnitDefinition(TestCase):
         Verify the runtime behavior of get_translated_data()
         """
         unit = Unit({})
-        with mock.patch.object(unit, "_provider"):
-            self.assertEqual(unit.get_translated_data(''), '')
+        unit._provider = mock.Mock()
+        self.assertEqual(unit.get_translated_data(''), '')
 
     def test_get_translated_data__None_msgid(self):
         """
         Verify the runtime behavior of get_translated_data()
         """
         unit = Unit({})
-        with mock.patch.object(unit, "_provider"):
-            self.assertEqual(unit.get_translated_data(None), None)
+        unit._provider = mock.Mock()
+        self.assertEqual(unit.get_translated_data(None), None)
 
     @mock.patch('plainbox.impl.unit.unit.normalize_rfc822_value')
     def test_get_normalized_translated_data__typical(self, mock_norm):
@@ -186,8 +196,8 @@ class TestUnitDefinition(TestCase):
         verify the runtime behavior of get_normalized_translated_data()
         """
         unit = Unit({})
-        with mock.patch.object(unit, "get_translated_data") as mock_tr:
-            retval = unit.get_normalized_translated_data('foo')
+        mock_tr = unit.get_translated_data = mock.Mock()
+        retval = unit.get_normalized_translated_data('foo')
         # get_translated_data('foo') was called
         mock_tr.assert_called_with("foo")
         # normalize_rfc822_value(x) was called
@@ -201,9 +211,8 @@ class TestUnitDefinition(TestCase):
         verify the runtime behavior of get_normalized_translated_data()
         """
         unit = Unit({})
-        with mock.patch.object(unit, "get_translated_data") as mock_tr:
-            mock_tr.return_value = None
-            retval = unit.get_normalized_translated_data('foo')
+        mock_tr = unit.get_translated_data = mock.Mock(return_value=None)
+        retval = unit.get_normalized_translated_data('foo')
         # get_translated_data('foo') was called
         mock_tr.assert_called_with("foo")
         # normalize_rfc822_value(x) was NOT called
@@ -232,6 +241,9 @@ class TestUnitDefinition(TestCase):
         self.assertEqual(
             unit3.checksum,
             "5558e5231fb192e8126ed69d950972fa878375d1364a221ed6550852e7d5cde0")
+        # The checksum is computed once and memoized on the instance,
+        # repeated access returns the very same string
+        self.assertIs(unit1.checksum, unit1.checksum)
 
     def test_comparison(self):
         # Ensure that units with equal data are equal
@@ -243,8 +255,8 @@ class TestUnitDefinition(TestCase):
         # Ensure that units with equal data but different origin are still
         # equal
         self.assertEqual(
-            Unit({}, origin=mock.Mock()),
-            Unit({}, origin=mock.Mock()))
+            Unit({}, origin=object()),
+            Unit({}, origin=object()))
         # Ensure that units with equal data but different provider are still
         # equal
         self.assertEqual(
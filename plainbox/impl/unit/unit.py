@@ -43,6 +43,7 @@ from plainbox.impl.symbol import Symbol
 from plainbox.impl.symbol import SymbolDef
 from plainbox.impl.symbol import SymbolDefMeta
 from plainbox.impl.symbol import SymbolDefNs
+from plainbox.impl.unit import _EMPTY_FROZENSET
 from plainbox.impl.unit import concrete_validators
 from plainbox.impl.unit import get_accessed_parameters
 from plainbox.impl.unit.validators import IFieldValidator
@@ -338,10 +339,12 @@ class UnitType(abc.ABCMeta):
                 # The list of base fields needs to be a tuple
                 merged_fields_bases = tuple(merged_fields_bases)
                 # Copy all of the Symbol objects out of the our_meta.field
-                # class that we're re-defining.
+                # class that we're re-defining. Only the class namespace
+                # itself needs to be scanned (inherited symbols come in via
+                # merged_fields_bases) so there's no need to pay for the
+                # full MRO walk that dir() does.
                 merged_fields_ns = SymbolDefNs()
-                for sym_name in dir(our_meta.fields):
-                    sym = getattr(our_meta.fields, sym_name)
+                for sym_name, sym in vars(our_meta.fields).items():
                     if isinstance(sym, Symbol):
                         merged_fields_ns[sym_name] = sym
                 merged_fields_ns['__doc__'] = """
@@ -583,7 +586,7 @@ class Unit(metaclass=UnitType):
                 for key, value in self._data.items()
             }
         else:
-            return {key: frozenset() for key in self._data}
+            return {key: _EMPTY_FROZENSET for key in self._data}
 
     @classmethod
     def from_rfc822_record(cls, record, provider=None):
@@ -432,8 +432,19 @@ class ProviderManagerToolTests(TestCase):
             "[Executables]\n"
             "\t'test.sh'\n"))
 
+    @classmethod
+    def setUpClass(cls):
+        # Share one scratch root across the whole class; each test gets its
+        # own sub-directory so removing the tree once in tearDownClass is
+        # enough and the per-test rmtree churn is avoided.
+        cls._scratch_root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._scratch_root)
+
     def setUp(self):
-        self.tmpdir = tempfile.mkdtemp()
+        self.tmpdir = tempfile.mkdtemp(dir=self._scratch_root)
         self.definition = self._create_definition(self.tmpdir)
         self.tool = ProviderManagerTool(self.definition)
 
@@ -479,9 +490,6 @@ class ProviderManagerToolTests(TestCase):
         definition.gettext_domain = "domain"
         return definition
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
-
     def assertFileContent(self, filename, content):
         """
         assert that a file has the specified content
@@ -181,6 +181,22 @@ class TestCaseWithParameters(TestCase):
         """
         return cls.parameter_values
 
+    def _get_parameter_values_list(self):
+        """
+        Internal implementation method of TestCaseWithParameters.
+
+        Returns get_parameter_values() as a list, computed once per class.
+        Both run() and countTestCases() are called for every test method so
+        without the cache a subclass with an expensive (e.g. discovery
+        based) get_parameter_values() would re-run it over and over.
+        """
+        cls = type(self)
+        # Look only at cls.__dict__ so that each subclass gets its own cache
+        # rather than inheriting the one from a base class.
+        if '_parameter_values_cache' not in cls.__dict__:
+            cls._parameter_values_cache = list(self.get_parameter_values())
+        return cls._parameter_values_cache
+
     def _parametrize(self, parameters):
         """
         Internal implementation method of TestCaseWithParameters.
@@ -202,12 +218,7 @@ class TestCaseWithParameters(TestCase):
         Each parametrized instance (created with _parametrize()) returns 1
         """
         if self.parameters is None:
-            try:
-                return len(self.get_parameter_values())
-            except TypeError:
-                # if get_parameter_values() returns a generator then
-                # we need to count it ourselves
-                return len(list(self.get_parameter_values()))
+            return len(self._get_parameter_values_list())
         else:
             return 1
 
@@ -226,7 +237,8 @@ class TestCaseWithParameters(TestCase):
         # Get the list of parameter names
         names = self.get_parameter_names()
         # For each list of parameter values:
-        for iteration_index, values in enumerate(self.get_parameter_values()):
+        for iteration_index, values in enumerate(
+                self._get_parameter_values_list()):
             if len(values) != len(names):
                 raise RuntimeError((
                     "incorrect get_parameter_values() or parameter_values for"